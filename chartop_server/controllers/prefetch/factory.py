@@ -0,0 +1,26 @@
+from chartop_server.controllers.prefetch.prefetcher import AccessPatternPrefetcher
+from chartop_server.controllers.tsdb.factory import TSDBControllerContainer
+
+
+class AccessPatternPrefetcherContainer:
+    prefetcher: AccessPatternPrefetcher | None = None
+    initialized: bool = False
+
+    @staticmethod
+    def init_prefetcher(prefetcher: AccessPatternPrefetcher | None = None):
+        if prefetcher is None:
+            prefetcher = AccessPatternPrefetcher.from_env(
+                controller=TSDBControllerContainer.get_controller()
+            )
+        # started separately, once the controller is warmed up
+        AccessPatternPrefetcherContainer.prefetcher = prefetcher
+        AccessPatternPrefetcherContainer.initialized = True
+
+    @staticmethod
+    def get_prefetcher() -> AccessPatternPrefetcher:
+        if (
+            not AccessPatternPrefetcherContainer.initialized
+            or AccessPatternPrefetcherContainer.prefetcher is None
+        ):
+            raise RuntimeError("Prefetcher not initialized")
+        return AccessPatternPrefetcherContainer.prefetcher
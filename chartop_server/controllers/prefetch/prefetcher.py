@@ -0,0 +1,307 @@
+import asyncio
+import json
+import os
+import pathlib
+import time
+
+import structlog
+
+from chartop_server.controllers.tsdb.controller import TSDBController
+from chartop_server.models import ChartopResponse
+from chartop_server.utils.utils import get_visualization_vectors_ts_window
+
+from pva_tsdb_connector.enums import AllOrAnyTags
+
+
+CHARTOP_KIND = "chartop"
+VISUALIZATION_VECTORS_KIND = "visualization_vectors"
+# params each kind of key must carry to be replayed
+KIND_PARAMS: dict[str, set[str]] = {
+    CHARTOP_KIND: {
+        "page_number",
+        "page_size",
+        "order_by",
+        "order_asc",
+        "tags",
+        "all_or_any_tags",
+    },
+    VISUALIZATION_VECTORS_KIND: {
+        "origin_ts_uid",
+        "radius",
+        "limit",
+        "exclude_ts_uids",
+    },
+}
+
+
+class AccessPatternPrefetcher:
+    """
+    Counts normalized request keys with exponentially decayed frequencies and
+    replays the most popular ones through the controller, so that the database
+    pages behind popular views are already cached when users arrive.
+
+    Counts survive restarts only through 'state_file'. Each worker keeps its own
+    counts and overwrites the whole file, so with several workers sharing one
+    state file the last writer wins.
+    """
+
+    def __init__(
+        self,
+        controller: TSDBController,
+        enabled: bool = False,
+        top_k: int = 50,
+        rate_per_second: float = 2.0,
+        half_life_seconds: float = 24 * 3600,
+        check_interval_seconds: float = 300,
+        max_keys: int = 10000,
+        state_file: str | None = None,
+    ):
+        if rate_per_second <= 0:
+            raise ValueError("Prefetch rate per second must be positive.")
+        self._controller = controller
+        self._enabled = enabled
+        self._top_k = top_k
+        self._rate_per_second = rate_per_second
+        self._half_life_seconds = half_life_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._max_keys = max_keys
+        self._state_file = state_file
+        # key -> (score, time.time() at which score was last decayed)
+        self._scores: dict[str, tuple[float, float]] = dict()
+        self._data_fingerprint: int | None = None
+        self._task: asyncio.Task | None = None
+        self._logger = structlog.getLogger(component="AccessPatternPrefetcher")
+
+    @staticmethod
+    def from_env(controller: TSDBController) -> "AccessPatternPrefetcher":
+        return AccessPatternPrefetcher(
+            controller=controller,
+            enabled=os.getenv("PREFETCH_ENABLED", "false").lower() == "true",
+            top_k=int(os.getenv("PREFETCH_TOP_K", "50")),
+            rate_per_second=float(os.getenv("PREFETCH_RATE_PER_SECOND", "2")),
+            half_life_seconds=float(os.getenv("PREFETCH_HALF_LIFE_HOURS", "24")) * 3600,
+            check_interval_seconds=float(
+                os.getenv("PREFETCH_CHECK_INTERVAL_SECONDS", "300")
+            ),
+            state_file=os.getenv("PREFETCH_STATE_FILE", None),
+        )
+
+    def record_chartop(
+        self,
+        page_number: int,
+        page_size: int,
+        order_by: int,
+        order_asc: bool,
+        tags: list[int] | None,
+        all_or_any_tags: AllOrAnyTags,
+    ) -> None:
+        self._record(
+            CHARTOP_KIND,
+            page_number=page_number,
+            page_size=page_size,
+            order_by=order_by,
+            order_asc=order_asc,
+            tags=sorted(set(tags)) if tags else None,
+            all_or_any_tags=all_or_any_tags.value,
+        )
+
+    def record_visualization_vectors(
+        self,
+        origin_ts_uid: int,
+        radius: float,
+        limit: int,
+        exclude_ts_uids: list[int] | None,
+    ) -> None:
+        self._record(
+            VISUALIZATION_VECTORS_KIND,
+            origin_ts_uid=origin_ts_uid,
+            radius=radius,
+            limit=limit,
+            exclude_ts_uids=sorted(set(exclude_ts_uids)) if exclude_ts_uids else None,
+        )
+
+    def _record(self, kind: str, **params) -> None:
+        if not self._enabled:
+            return
+        key = json.dumps({"kind": kind, "params": params}, sort_keys=True)
+        now = time.time()
+        self._scores[key] = (self._decayed_score(key, now) + 1.0, now)
+        if len(self._scores) > self._max_keys:
+            self._prune(now)
+
+    def _decayed_score(self, key: str, now: float) -> float:
+        score, last_time = self._scores.get(key, (0.0, now))
+        return score * 0.5 ** ((now - last_time) / self._half_life_seconds)
+
+    def _prune(self, now: float) -> None:
+        keep = sorted(
+            self._scores, key=lambda k: self._decayed_score(k, now), reverse=True
+        )[: int(self._max_keys * 0.8)]
+        self._scores = {k: self._scores[k] for k in keep}
+
+    def top_keys(self, k: int) -> list[dict]:
+        now = time.time()
+        keys = sorted(
+            self._scores, key=lambda key: self._decayed_score(key, now), reverse=True
+        )
+        return [json.loads(key) for key in keys[:k]]
+
+    @staticmethod
+    def _is_valid_key(key: str) -> bool:
+        try:
+            parsed = json.loads(key)
+            return KIND_PARAMS[parsed["kind"]] == set(parsed["params"])
+        except Exception:
+            return False
+
+    def load(self) -> None:
+        if self._state_file is None or not os.path.exists(self._state_file):
+            return
+        try:
+            state = json.loads(pathlib.Path(self._state_file).read_text())
+        except Exception as ex:
+            self._logger.warning(f"Failed to load access patterns: {ex}")
+            return
+        if not isinstance(state, dict):
+            self._logger.warning("Failed to load access patterns: not a JSON object")
+            return
+        scores: dict[str, tuple[float, float]] = dict()
+        skipped = 0
+        for k, v in state.items():
+            try:
+                score = (float(v[0]), float(v[1]))
+            except Exception:
+                skipped += 1
+                continue
+            if self._is_valid_key(k):
+                scores[k] = score
+            else:
+                skipped += 1
+        self._scores = scores
+        self._logger.info(
+            f"Loaded {len(self._scores)} access patterns, skipped {skipped} invalid"
+        )
+
+    def save(self) -> None:
+        if self._state_file is None or not self._enabled:
+            return
+        try:
+            path = pathlib.Path(self._state_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(self._scores))
+            tmp_path.replace(path)
+        except Exception as ex:
+            self._logger.warning(f"Failed to save access patterns: {ex}")
+
+    async def _replay(self, key: dict):
+        params = key["params"]
+        if key["kind"] == CHARTOP_KIND:
+            return await self._controller.get_chartop(
+                page_number=params["page_number"],
+                page_size=params["page_size"],
+                order_by=params["order_by"],
+                order_asc=params["order_asc"],
+                tags=params["tags"],
+                all_or_any_tags=AllOrAnyTags(params["all_or_any_tags"]),
+            )
+        start_date, newest_n = get_visualization_vectors_ts_window()
+        return await self._controller.get_visualization_vectors(
+            origin_vector=None,
+            origin_ts_uid=params["origin_ts_uid"],
+            radius=params["radius"],
+            limit=params["limit"],
+            exclude_ts_uids=params["exclude_ts_uids"],
+            start_date=start_date,
+            newest_n=newest_n,
+        )
+
+    @staticmethod
+    def _fingerprint(response: ChartopResponse) -> int:
+        return max(
+            (
+                op.metadata.successful_last_update_time
+                for entry in response.data.chartop_entries
+                for op in entry.operands
+            ),
+            default=0,
+        )
+
+    async def _probe_data_changed(self) -> bool:
+        """Replays the most popular chartop and compares its last update times."""
+        probe = next(
+            (k for k in self.top_keys(self._top_k) if k["kind"] == CHARTOP_KIND), None
+        )
+        if probe is None:
+            return False
+        fingerprint = self._fingerprint(await self._replay(probe))
+        changed = (
+            self._data_fingerprint is not None and fingerprint != self._data_fingerprint
+        )
+        self._data_fingerprint = fingerprint
+        return changed
+
+    async def warm(self) -> None:
+        keys = self.top_keys(self._top_k)
+        start = time.perf_counter()
+        warmed = 0
+        for key in keys:
+            try:
+                response = await self._replay(key)
+                warmed += 1
+                if key["kind"] == CHARTOP_KIND and self._data_fingerprint is None:
+                    self._data_fingerprint = self._fingerprint(response)
+            except Exception as ex:
+                self._logger.warning(f"Failed to prefetch {key}: {ex}")
+            await asyncio.sleep(1 / self._rate_per_second)
+        self._logger.info(
+            f"Prefetched {warmed}/{len(keys)} popular requests "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+
+    async def _run(self) -> None:
+        try:
+            await self.warm()
+        except Exception as ex:
+            self._logger.exception(f"Failed to prefetch on startup: {ex}", exc_info=ex)
+        while True:
+            await asyncio.sleep(self._check_interval_seconds)
+            self.save()
+            try:
+                if await self._probe_data_changed():
+                    self._logger.info("Underlying data changed, prefetching again")
+                    await self.warm()
+            except Exception as ex:
+                self._logger.warning(f"Failed to check for data changes: {ex}")
+
+    def start(self) -> None:
+        if not self._enabled:
+            return
+        if self._state_file is None:
+            self._logger.warning(
+                "Prefetching without PREFETCH_STATE_FILE, counts start empty after "
+                "every deploy so nothing is prefetched on startup"
+            )
+        self.load()
+        self._task = asyncio.create_task(self._run())
+        self._task.add_done_callback(self._log_task_failure)
+
+    def _log_task_failure(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.error(
+                f"Prefetching stopped unexpectedly: {task.exception()}",
+                exc_info=task.exception(),
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                # already logged by _log_task_failure, shutdown must go on
+                pass
+            self._task = None
+        self.save()
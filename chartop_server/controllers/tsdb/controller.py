@@ -1,23 +1,35 @@
+import asyncio
 import datetime
 from collections import defaultdict
 
+import numpy as np
 import structlog
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, AsyncExitStack
 from chartop_server.controllers.tsdb.exceptions import TSDBControllerException
 from chartop_server.models import (
     ChartopResponse,
     ChartopExternal,
     SingleTimeseriesExternal,
+    SingleTSMetadataExternal,
     TagsResponse,
     MetricsResponse,
     VisualizationVectorsResponse,
     VisualizationVectorsWithOriginExternal,
+    VisualizationVectorsNeighborhoodExternal,
+    MultiOriginVisualizationVectorsExternal,
+    MultiOriginVisualizationVectorsResponse,
+    SummaryStatisticsResponse,
+    TSSummaryStatisticsExternal,
+    WindowStatisticsExternal,
 )
 from chartop_server.models.models import (
     ChartopEntryExternal,
     TSWithVisualizationVectorExternal,
 )
 from chartop_server.utils import group_by
+from chartop_server.utils.statistics import compute_window_statistics
+from chartop_server.utils.profiling import profile_stage, profiled
+from chartop_server.utils.utils import get_visualization_vectors_ts_window
 
 from pva_tsdb_connector.postgres_connector.connector import (
     AsyncPostgresSQLAlchemyCoreConnector,
@@ -29,12 +41,19 @@ from pva_tsdb_connector.postgres_connector.configs import (
 from pva_tsdb_connector.enums import AllOrAnyTags
 from pva_tsdb_connector.models import (
     TSDataModel,
+    TSMetadataModel,
+    TSToTagModel,
     TSToMetricModel,
     MetricValueWithOperands,
     TSWithVisualizationVectorModel,
 )
 
 
+MAX_VISUALIZATION_VECTORS_ORIGINS = 10
+# SQLAlchemy's QueuePool default
+DEFAULT_POOL_SIZE = 5
+
+
 class TSDBController:
     def __init__(self, connection_settings: ConnectionSettings):
         self._connection_settings: ConnectionSettings = connection_settings
@@ -53,6 +72,69 @@ class TSDBController:
         await self._connector.connect()
         self._logger.info("Initialized TSDBController's TSDBConnector")
 
+    async def _fetch_enrichment(
+        self,
+        conn,
+        ts_uids: list[int],
+        start_date: datetime.datetime | None = None,
+        newest_n: int | None = None,
+    ) -> tuple[
+        dict[int, list[TSToTagModel]],
+        dict[int, list[TSToMetricModel]],
+        dict[int, list[TSDataModel]],
+    ]:
+        """Fetches tags, metrics and ascending points of 'ts_uids', keyed by TS UID."""
+        try:
+            with profile_stage("db.get_ts_to_tags"):
+                ts_to_tag_models = await self._connector.get_ts_to_tags(
+                    conn=conn, ts_uids=ts_uids
+                )
+            ts_to_tag_models_per_ts_uid = group_by(
+                ts_to_tag_models, self._connector.ts_to_tag_ts_uid_col.lower()
+            )
+        except Exception as ex:
+            raise TSDBControllerException(
+                message="Failed to get tags for timeseries.", http_status_code=500
+            ) from ex
+
+        try:
+            with profile_stage("db.get_ts_to_metrics"):
+                ts_to_metric_models = await self._connector.get_ts_to_metrics(
+                    conn=conn, ts_uids=ts_uids, metric_uids=list(range(1, 16))
+                )
+            ts_to_metric_models_per_ts_uid: dict[int, list[TSToMetricModel]] = (
+                defaultdict(list)
+            )
+            for m in ts_to_metric_models:
+                ts_to_metric_models_per_ts_uid[m.ts_uids[0]].append(m)
+        except Exception as ex:
+            raise TSDBControllerException(
+                message="Failed to get metrics for timeseries.",
+                http_status_code=500,
+            ) from ex
+
+        try:
+            with profile_stage("db.get_timeseries"):
+                ts_models: list[TSDataModel] = await self._connector.get_timeseries(
+                    conn=conn,
+                    ts_uids=ts_uids,
+                    order_asc=True,
+                    start_date=start_date,
+                    newest_n=newest_n,
+                )
+            ts_models_by_uid = group_by(ts_models, "uid")
+        except Exception as ex:
+            raise TSDBControllerException(
+                message="Failed to get timeseries points.", http_status_code=500
+            ) from ex
+
+        return (
+            ts_to_tag_models_per_ts_uid,
+            ts_to_metric_models_per_ts_uid,
+            ts_models_by_uid,
+        )
+
+    @profiled
     async def get_chartop(
         self,
         page_number: int,
@@ -64,17 +146,18 @@ class TSDBController:
     ) -> ChartopResponse:
         async with self.connect() as conn:
             try:
-                chartop: list[
-                    MetricValueWithOperands
-                ] = await self._connector.get_ordered_values_and_operands(
-                    conn=conn,
-                    order_by_metric_uid=order_by,
-                    order_asc=order_asc,
-                    tag_uids=tags,
-                    all_or_any_tags=all_or_any_tags,
-                    limit=page_size,
-                    offset=page_number * page_size,
-                )
+                with profile_stage("db.get_ordered_values_and_operands"):
+                    chartop: list[
+                        MetricValueWithOperands
+                    ] = await self._connector.get_ordered_values_and_operands(
+                        conn=conn,
+                        order_by_metric_uid=order_by,
+                        order_asc=order_asc,
+                        tag_uids=tags,
+                        all_or_any_tags=all_or_any_tags,
+                        limit=page_size,
+                        offset=page_number * page_size,
+                    )
                 ts_uids = [op.uid for m in chartop for op in m.operands]
             except Exception as ex:
                 raise TSDBControllerException(
@@ -82,9 +165,10 @@ class TSDBController:
                 ) from ex
 
             try:
-                ts_to_tag_models = await self._connector.get_ts_to_tags(
-                    conn=conn, ts_uids=ts_uids
-                )
+                with profile_stage("db.get_ts_to_tags"):
+                    ts_to_tag_models = await self._connector.get_ts_to_tags(
+                        conn=conn, ts_uids=ts_uids
+                    )
                 ts_to_tag_models_per_ts_uid = group_by(
                     ts_to_tag_models, self._connector.ts_to_tag_ts_uid_col.lower()
                 )
@@ -94,9 +178,10 @@ class TSDBController:
                 ) from ex
 
             try:
-                ts_to_metric_models = await self._connector.get_ts_to_metrics(
-                    conn=conn, ts_uids=ts_uids, metric_uids=list(range(1, 16))
-                )
+                with profile_stage("db.get_ts_to_metrics"):
+                    ts_to_metric_models = await self._connector.get_ts_to_metrics(
+                        conn=conn, ts_uids=ts_uids, metric_uids=list(range(1, 16))
+                    )
                 ts_to_metric_models_per_ts_uid: dict[int, list[TSToMetricModel]] = (
                     defaultdict(list)
                 )
@@ -109,9 +194,10 @@ class TSDBController:
                 ) from ex
 
             try:
-                ts_models: list[TSDataModel] = await self._connector.get_timeseries(
-                    conn=conn, ts_uids=ts_uids, order_asc=True
-                )
+                with profile_stage("db.get_timeseries"):
+                    ts_models: list[TSDataModel] = await self._connector.get_timeseries(
+                        conn=conn, ts_uids=ts_uids, order_asc=True
+                    )
                 ts_models_by_uid = group_by(ts_models, "uid")
             except Exception as ex:
                 raise TSDBControllerException(
@@ -119,50 +205,55 @@ class TSDBController:
                 ) from ex
 
             try:
-                ts_uids_with_vv: set[int] = set(
-                    await self._connector.get_ts_uids_with_vv(
-                        conn=conn,
-                        ts_uids=ts_uids,
+                with profile_stage("db.get_ts_uids_with_vv"):
+                    ts_uids_with_vv: set[int] = set(
+                        await self._connector.get_ts_uids_with_vv(
+                            conn=conn,
+                            ts_uids=ts_uids,
+                        )
                     )
-                )
             except Exception as ex:
                 raise TSDBControllerException(
                     message="Failed to get visualization vectors for timeseries.",
                     http_status_code=500,
                 ) from ex
 
-        chartop_external: list[ChartopEntryExternal] = list()
-        for chartop_entry in chartop:
-            external_operands: list[SingleTimeseriesExternal] = list()
-            for meta_model in chartop_entry.operands:
-                external_operands.append(
-                    SingleTimeseriesExternal.from_db_models(
-                        meta_model=meta_model,
-                        ts_models=ts_models_by_uid[meta_model.uid],
-                        ts_to_tag_models=ts_to_tag_models_per_ts_uid.get(
-                            meta_model.uid, []
-                        ),
-                        ts_to_metric_models=ts_to_metric_models_per_ts_uid.get(
-                            meta_model.uid, []
-                        ),
-                        ts_uids_with_vv=ts_uids_with_vv,
+        with profile_stage("from_db_models"):
+            chartop_external: list[ChartopEntryExternal] = list()
+            for chartop_entry in chartop:
+                external_operands: list[SingleTimeseriesExternal] = list()
+                for meta_model in chartop_entry.operands:
+                    external_operands.append(
+                        SingleTimeseriesExternal.from_db_models(
+                            meta_model=meta_model,
+                            ts_models=ts_models_by_uid[meta_model.uid],
+                            ts_to_tag_models=ts_to_tag_models_per_ts_uid.get(
+                                meta_model.uid, []
+                            ),
+                            ts_to_metric_models=ts_to_metric_models_per_ts_uid.get(
+                                meta_model.uid, []
+                            ),
+                            ts_uids_with_vv=ts_uids_with_vv,
+                        )
+                    )
+                chartop_external.append(
+                    ChartopEntryExternal(
+                        operands=external_operands,
+                        order_by_metric_value=chartop_entry.metric_value,
                     )
                 )
-            chartop_external.append(
-                ChartopEntryExternal(
-                    operands=external_operands,
-                    order_by_metric_value=chartop_entry.metric_value,
-                )
+        with profile_stage("build_response"):
+            response = ChartopResponse(
+                success=True,
+                message="Successfully retrieved timeseries.",
+                data=ChartopExternal(
+                    chartop_entries=chartop_external,
+                    order_by_metric_uid=order_by,
+                ),
             )
-        return ChartopResponse(
-            success=True,
-            message="Successfully retrieved timeseries.",
-            data=ChartopExternal(
-                chartop_entries=chartop_external,
-                order_by_metric_uid=order_by,
-            ),
-        )
+        return response
 
+    @profiled
     async def get_visualization_vectors(
         self,
         origin_vector: list[float] | None,
@@ -183,16 +274,17 @@ class TSDBController:
 
         async with self.connect() as conn:
             try:
-                ts_with_vectors: list[
-                    TSWithVisualizationVectorModel
-                ] = await self._connector.get_ts_with_visualization_vector(
-                    conn=conn,
-                    origin_vector=origin_vector,
-                    origin_ts_uid=origin_ts_uid,
-                    radius=radius,
-                    limit=limit,
-                    exclude_ts_uids=exclude_ts_uids,
-                )
+                with profile_stage("db.get_ts_with_visualization_vector"):
+                    ts_with_vectors: list[
+                        TSWithVisualizationVectorModel
+                    ] = await self._connector.get_ts_with_visualization_vector(
+                        conn=conn,
+                        origin_vector=origin_vector,
+                        origin_ts_uid=origin_ts_uid,
+                        radius=radius,
+                        limit=limit,
+                        exclude_ts_uids=exclude_ts_uids,
+                    )
                 ts_uids = [m.metadata.uid for m in ts_with_vectors]
             except Exception as ex:
                 raise TSDBControllerException(
@@ -201,9 +293,10 @@ class TSDBController:
                 ) from ex
 
             try:
-                ts_to_metric_models = await self._connector.get_ts_to_metrics(
-                    conn=conn, ts_uids=ts_uids, metric_uids=list(range(1, 16))
-                )
+                with profile_stage("db.get_ts_to_metrics"):
+                    ts_to_metric_models = await self._connector.get_ts_to_metrics(
+                        conn=conn, ts_uids=ts_uids, metric_uids=list(range(1, 16))
+                    )
                 ts_to_metric_models_per_ts_uid: dict[int, list[TSToMetricModel]] = (
                     defaultdict(list)
                 )
@@ -216,9 +309,10 @@ class TSDBController:
                 ) from ex
 
             try:
-                ts_to_tag_models = await self._connector.get_ts_to_tags(
-                    conn=conn, ts_uids=ts_uids
-                )
+                with profile_stage("db.get_ts_to_tags"):
+                    ts_to_tag_models = await self._connector.get_ts_to_tags(
+                        conn=conn, ts_uids=ts_uids
+                    )
                 ts_to_tag_models_per_ts_uid = group_by(
                     ts_to_tag_models, self._connector.ts_to_tag_ts_uid_col.lower()
                 )
@@ -228,13 +322,14 @@ class TSDBController:
                 ) from ex
 
             try:
-                ts_models: list[TSDataModel] = await self._connector.get_timeseries(
-                    conn=conn,
-                    ts_uids=ts_uids,
-                    order_asc=True,
-                    start_date=start_date,
-                    newest_n=newest_n,
-                )
+                with profile_stage("db.get_timeseries"):
+                    ts_models: list[TSDataModel] = await self._connector.get_timeseries(
+                        conn=conn,
+                        ts_uids=ts_uids,
+                        order_asc=True,
+                        start_date=start_date,
+                        newest_n=newest_n,
+                    )
                 ts_models_by_uid = group_by(ts_models, "uid")
             except Exception as ex:
                 raise TSDBControllerException(
@@ -242,35 +337,38 @@ class TSDBController:
                     http_status_code=500,
                 ) from ex
 
-        origin: list[float] | None = None
-        ts_with_visualization_vectors: list[TSWithVisualizationVectorExternal] = list()
-        for entry in ts_with_vectors:
-            single_ts = SingleTimeseriesExternal.from_db_models(
-                meta_model=entry.metadata,
-                ts_models=ts_models_by_uid.get(entry.metadata.uid, list()),
-                ts_to_tag_models=ts_to_tag_models_per_ts_uid.get(
-                    entry.metadata.uid, []
-                ),
-                ts_to_metric_models=ts_to_metric_models_per_ts_uid.get(
-                    entry.metadata.uid, list()
-                ),
+        with profile_stage("from_db_models"):
+            origin: list[float] | None = None
+            ts_with_visualization_vectors: list[TSWithVisualizationVectorExternal] = (
+                list()
             )
-            ts_with_visualization_vectors.append(
-                TSWithVisualizationVectorExternal(
-                    timestamps=single_ts.timestamps,
-                    values=single_ts.values,
-                    metadata=single_ts.metadata,
-                    visualization_vector=entry.visualization_vector,
+            for entry in ts_with_vectors:
+                single_ts = SingleTimeseriesExternal.from_db_models(
+                    meta_model=entry.metadata,
+                    ts_models=ts_models_by_uid.get(entry.metadata.uid, list()),
+                    ts_to_tag_models=ts_to_tag_models_per_ts_uid.get(
+                        entry.metadata.uid, []
+                    ),
+                    ts_to_metric_models=ts_to_metric_models_per_ts_uid.get(
+                        entry.metadata.uid, list()
+                    ),
                 )
-            )
-            if origin_ts_uid is not None and origin_ts_uid == entry.metadata.uid:
-                origin = entry.visualization_vector
+                ts_with_visualization_vectors.append(
+                    TSWithVisualizationVectorExternal(
+                        timestamps=single_ts.timestamps,
+                        values=single_ts.values,
+                        metadata=single_ts.metadata,
+                        visualization_vector=entry.visualization_vector,
+                    )
+                )
+                if origin_ts_uid is not None and origin_ts_uid == entry.metadata.uid:
+                    origin = entry.visualization_vector
 
-        if origin_ts_uid is not None and origin is None:
-            raise TSDBControllerException(
-                message=f"Failed to locate origin TS UID {origin_ts_uid}.",
-                http_status_code=404,
-            )
+            if origin_ts_uid is not None and origin is None:
+                raise TSDBControllerException(
+                    message=f"Failed to locate origin TS UID {origin_ts_uid}.",
+                    http_status_code=404,
+                )
 
         return VisualizationVectorsResponse(
             success=True,
@@ -281,6 +379,277 @@ class TSDBController:
             ),
         )
 
+    @profiled
+    async def get_multi_origin_visualization_vectors(
+        self,
+        origin_vectors: list[list[float]] | None,
+        origin_ts_uids: list[int] | None,
+        radius: float,
+        limit: int,
+        exclude_ts_uids: list[int] | None = None,
+        start_date: datetime.datetime | None = None,
+        newest_n: int | None = None,
+    ) -> MultiOriginVisualizationVectorsResponse:
+        origins: list[tuple[list[float] | None, int | None]] = [
+            (None, uid) for uid in origin_ts_uids or []
+        ] + [(vector, None) for vector in origin_vectors or []]
+        if not origins:
+            raise TSDBControllerException(
+                message="Specify at least one of 'origin_vectors', 'origin_ts_uids'.",
+                http_status_code=400,
+            )
+        if len(origins) > MAX_VISUALIZATION_VECTORS_ORIGINS:
+            raise TSDBControllerException(
+                message=f"Specify at most {MAX_VISUALIZATION_VECTORS_ORIGINS} origins.",
+                http_status_code=400,
+            )
+
+        async with self.connect() as conn:
+            # neighborhoods overlap, so series found by several searches are
+            # enriched only once and referenced by UID from each neighborhood
+            # repeated origins are searched once and share their neighborhood
+            searches: dict[
+                tuple[tuple[float, ...] | None, int | None],
+                list[TSWithVisualizationVectorModel],
+            ] = dict()
+            ts_with_vectors_by_uid: dict[int, TSWithVisualizationVectorModel] = dict()
+            try:
+                for origin_vector, origin_ts_uid in origins:
+                    key = (
+                        tuple(origin_vector) if origin_vector is not None else None,
+                        origin_ts_uid,
+                    )
+                    if key in searches:
+                        continue
+                    with profile_stage("db.get_ts_with_visualization_vector"):
+                        searches[
+                            key
+                        ] = await self._connector.get_ts_with_visualization_vector(
+                            conn=conn,
+                            origin_vector=origin_vector,
+                            origin_ts_uid=origin_ts_uid,
+                            radius=radius,
+                            limit=limit,
+                            exclude_ts_uids=exclude_ts_uids,
+                        )
+                    for m in searches[key]:
+                        ts_with_vectors_by_uid.setdefault(m.metadata.uid, m)
+                ts_uids = list(ts_with_vectors_by_uid.keys())
+            except Exception as ex:
+                raise TSDBControllerException(
+                    message="Failed to get timeseries with visualization vectors.",
+                    http_status_code=500,
+                ) from ex
+
+            (
+                ts_to_tag_models_per_ts_uid,
+                ts_to_metric_models_per_ts_uid,
+                ts_models_by_uid,
+            ) = await self._fetch_enrichment(
+                conn=conn, ts_uids=ts_uids, start_date=start_date, newest_n=newest_n
+            )
+
+        with profile_stage("from_db_models"):
+            ts_with_visualization_vectors: list[TSWithVisualizationVectorExternal] = (
+                list()
+            )
+            for uid, entry in ts_with_vectors_by_uid.items():
+                single_ts = SingleTimeseriesExternal.from_db_models(
+                    meta_model=entry.metadata,
+                    ts_models=ts_models_by_uid.get(uid, list()),
+                    ts_to_tag_models=ts_to_tag_models_per_ts_uid.get(uid, []),
+                    ts_to_metric_models=ts_to_metric_models_per_ts_uid.get(uid, list()),
+                    # every neighbor was found by a vector search, so has a vector
+                    ts_uids_with_vv=set(ts_with_vectors_by_uid),
+                )
+                ts_with_visualization_vectors.append(
+                    TSWithVisualizationVectorExternal(
+                        timestamps=single_ts.timestamps,
+                        values=single_ts.values,
+                        metadata=single_ts.metadata,
+                        visualization_vector=entry.visualization_vector,
+                    )
+                )
+
+            neighborhoods_external: list[VisualizationVectorsNeighborhoodExternal] = (
+                list()
+            )
+            for origin_vector, origin_ts_uid in origins:
+                ts_with_vectors = searches[
+                    (
+                        tuple(origin_vector) if origin_vector is not None else None,
+                        origin_ts_uid,
+                    )
+                ]
+                origin: list[float] | None = origin_vector
+                if origin_ts_uid is not None:
+                    origin = next(
+                        (
+                            m.visualization_vector
+                            for m in ts_with_vectors
+                            if m.metadata.uid == origin_ts_uid
+                        ),
+                        None,
+                    )
+                    if origin is None:
+                        raise TSDBControllerException(
+                            message=f"Failed to locate origin TS UID {origin_ts_uid}.",
+                            http_status_code=404,
+                        )
+                neighborhoods_external.append(
+                    VisualizationVectorsNeighborhoodExternal(
+                        origin_ts_uid=origin_ts_uid,
+                        origin=origin,
+                        ts_uids=[m.metadata.uid for m in ts_with_vectors],
+                    )
+                )
+
+        return MultiOriginVisualizationVectorsResponse(
+            success=True,
+            message="Successfully retrieved visualization vectors.",
+            data=MultiOriginVisualizationVectorsExternal(
+                ts_with_visualization_vectors=ts_with_visualization_vectors,
+                neighborhoods=neighborhoods_external,
+            ),
+        )
+
+    @profiled
+    async def get_summary_statistics(
+        self,
+        windows: list[tuple[str, datetime.timedelta | None]],
+        ts_uids: list[int] | None = None,
+        order_by: int | None = None,
+        page_number: int = 0,
+        page_size: int = 5,
+        order_asc: bool = True,
+        tags: list[int] | None = None,
+        all_or_any_tags: AllOrAnyTags = AllOrAnyTags.ANY,
+    ) -> SummaryStatisticsResponse:
+        if (ts_uids is None) == (order_by is None):
+            raise TSDBControllerException(
+                message="Specify exactly one of 'ts_uids', 'order_by'.",
+                http_status_code=400,
+            )
+
+        async with self.connect() as conn:
+            meta_models: list[TSMetadataModel]
+            if ts_uids is not None:
+                try:
+                    with profile_stage("db.get_ts_metadata"):
+                        meta_models = await self._connector.get_ts_metadata(
+                            conn=conn, ts_uids=ts_uids
+                        )
+                except Exception as ex:
+                    raise TSDBControllerException(
+                        message="Failed to get timeseries metadata.",
+                        http_status_code=500,
+                    ) from ex
+                meta_models_by_uid = {m.uid: m for m in meta_models}
+                missing_ts_uids = [
+                    uid for uid in ts_uids if uid not in meta_models_by_uid
+                ]
+                if missing_ts_uids:
+                    raise TSDBControllerException(
+                        message=f"Failed to locate TS UIDs {missing_ts_uids}.",
+                        http_status_code=404,
+                    )
+                meta_models = [
+                    meta_models_by_uid[uid] for uid in dict.fromkeys(ts_uids)
+                ]
+            elif order_by is not None:
+                try:
+                    with profile_stage("db.get_ordered_values_and_operands"):
+                        chartop: list[
+                            MetricValueWithOperands
+                        ] = await self._connector.get_ordered_values_and_operands(
+                            conn=conn,
+                            order_by_metric_uid=order_by,
+                            order_asc=order_asc,
+                            tag_uids=tags,
+                            all_or_any_tags=all_or_any_tags,
+                            limit=page_size,
+                            offset=page_number * page_size,
+                        )
+                except Exception as ex:
+                    raise TSDBControllerException(
+                        message="Failed to filter timeseries.", http_status_code=500
+                    ) from ex
+                meta_models = list(
+                    {op.uid: op for m in chartop for op in m.operands}.values()
+                )
+            ts_uids = [m.uid for m in meta_models]
+
+            (
+                ts_to_tag_models_per_ts_uid,
+                ts_to_metric_models_per_ts_uid,
+                ts_models_by_uid,
+            ) = await self._fetch_enrichment(conn=conn, ts_uids=ts_uids)
+
+            try:
+                with profile_stage("db.get_ts_uids_with_vv"):
+                    ts_uids_with_vv: set[int] = set(
+                        await self._connector.get_ts_uids_with_vv(
+                            conn=conn,
+                            ts_uids=ts_uids,
+                        )
+                    )
+            except Exception as ex:
+                raise TSDBControllerException(
+                    message="Failed to get visualization vectors for timeseries.",
+                    http_status_code=500,
+                ) from ex
+
+        with profile_stage("compute_statistics"):
+            windows_ms: list[tuple[str, int | None]] = [
+                (spec, int(w.total_seconds() * 1000) if w is not None else None)
+                for spec, w in windows
+            ]
+            summaries: list[TSSummaryStatisticsExternal] = list()
+            for meta_model in meta_models:
+                points = ts_models_by_uid.get(meta_model.uid, list())
+                timestamps = np.fromiter(
+                    (int(p.time.timestamp() * 1000) for p in points),
+                    dtype=np.int64,
+                    count=len(points),
+                )
+                values = np.fromiter(
+                    (p.value for p in points), dtype=np.float64, count=len(points)
+                )
+                metadata = SingleTSMetadataExternal.from_db_models(
+                    meta_model=meta_model,
+                    ts_models=points,
+                    ts_to_tag_models=ts_to_tag_models_per_ts_uid.get(
+                        meta_model.uid, []
+                    ),
+                    ts_to_metric_models=ts_to_metric_models_per_ts_uid.get(
+                        meta_model.uid, []
+                    ),
+                    ts_uids_with_vv=ts_uids_with_vv,
+                )
+                summaries.append(
+                    TSSummaryStatisticsExternal(
+                        metadata=metadata,
+                        last_timestamp=int(timestamps[-1]) if len(points) > 0 else None,
+                        last_value=float(values[-1]) if len(points) > 0 else None,
+                        windows=[
+                            WindowStatisticsExternal(
+                                window=spec,
+                                **compute_window_statistics(
+                                    timestamps, values, window_ms
+                                ),
+                            )
+                            for spec, window_ms in windows_ms
+                        ],
+                    )
+                )
+
+        return SummaryStatisticsResponse(
+            success=True,
+            message="Successfully computed summary statistics.",
+            data=summaries,
+        )
+
+    @profiled
     async def get_tags(self) -> TagsResponse:
         async with self.connect() as conn:
             try:
@@ -293,6 +662,7 @@ class TSDBController:
                     message="Failed to get tags.", http_status_code=500
                 ) from ex
 
+    @profiled
     async def get_metrics(self) -> MetricsResponse:
         async with self.connect() as conn:
             try:
@@ -307,13 +677,95 @@ class TSDBController:
                     message="Failed to get metrics.", http_status_code=500
                 ) from ex
 
+    async def get_pool_size(self) -> int:
+        """Size of the connector's SQLAlchemy pool, without overflow connections."""
+        try:
+            async with self.connect() as conn:
+                return conn.engine.pool.size()
+        except Exception as ex:
+            self._logger.warning(
+                f"Failed to read pool size, assuming {DEFAULT_POOL_SIZE}: {ex}"
+            )
+            return DEFAULT_POOL_SIZE
+
+    async def warm_up(self, connections: int | None = None, radius: float = 2.5):
+        """
+        Checks out 'connections' pooled connections at once, capped at the pool
+        size, and runs the hot query shapes on each of them while they are held,
+        so that statements are compiled and prepared on every one of them.
+        """
+        pool_size = await self.get_pool_size()
+        connections = (
+            pool_size if connections is None else max(min(connections, pool_size), 0)
+        )
+        async with AsyncExitStack() as stack:
+            conns = await asyncio.gather(
+                *(stack.enter_async_context(self.connect()) for _ in range(connections))
+            )
+            self._logger.info(f"Opened {connections} pooled connections")
+            await asyncio.gather(
+                *(self._run_representative_queries(conn, radius) for conn in conns)
+            )
+        self._logger.info("Ran representative queries on pooled connections")
+
+    async def _run_representative_queries(self, conn, radius: float) -> None:
+        metrics = await self._connector.get_metrics(conn=conn)
+        tags = await self._connector.get_tags(conn=conn)
+        if not metrics:
+            return
+        chartop: list[
+            MetricValueWithOperands
+        ] = await self._connector.get_ordered_values_and_operands(
+            conn=conn,
+            order_by_metric_uid=metrics[0].uid,
+            order_asc=False,
+            tag_uids=None,
+            all_or_any_tags=AllOrAnyTags.ANY,
+            limit=5,
+            offset=0,
+        )
+        if tags:
+            await self._connector.get_ordered_values_and_operands(
+                conn=conn,
+                order_by_metric_uid=metrics[0].uid,
+                order_asc=False,
+                tag_uids=[tags[0].uid],
+                all_or_any_tags=AllOrAnyTags.ALL,
+                limit=5,
+                offset=0,
+            )
+        ts_uids = [op.uid for m in chartop for op in m.operands]
+        await self._fetch_enrichment(conn=conn, ts_uids=ts_uids)
+        ts_uids_with_vv = list(
+            await self._connector.get_ts_uids_with_vv(conn=conn, ts_uids=ts_uids)
+        )
+        if ts_uids_with_vv:
+            ts_with_vectors: list[
+                TSWithVisualizationVectorModel
+            ] = await self._connector.get_ts_with_visualization_vector(
+                conn=conn,
+                origin_vector=None,
+                origin_ts_uid=ts_uids_with_vv[0],
+                radius=radius,
+                limit=50,
+                exclude_ts_uids=None,
+            )
+            start_date, newest_n = get_visualization_vectors_ts_window()
+            await self._fetch_enrichment(
+                conn=conn,
+                ts_uids=[m.metadata.uid for m in ts_with_vectors],
+                start_date=start_date,
+                newest_n=newest_n,
+            )
+
     async def cleanup(self):
         await self._connector.close()
         self._logger.info("Closed TSDBController's TSDBConnector")
 
     @asynccontextmanager
     async def connect(self):
-        conn = await self._connector.get_connection()
+        with profile_stage("db.get_connection"):
+            conn = await self._connector.get_connection()
         try:
             yield conn
         finally:
@@ -1,3 +1,8 @@
+import os
+import time
+
+import structlog
+
 from pva_tsdb_connector.postgres_connector.configs import ConnectionSettings
 from chartop_server.controllers.tsdb.controller import TSDBController
 
@@ -6,9 +11,12 @@ class TSDBControllerContainer:
     controller_config: ConnectionSettings | None = None
     controller: TSDBController | None = None
     initialized: bool = False
+    ready: bool = False
+    init_started_at: float = 0.0
 
     @staticmethod
     async def init_controller(controller_config: ConnectionSettings | None = None):
+        TSDBControllerContainer.init_started_at = time.perf_counter()
         if controller_config is None:
             controller_config = ConnectionSettings()  # type: ignore
         TSDBControllerContainer.controller_config = controller_config
@@ -23,3 +31,21 @@ class TSDBControllerContainer:
         if not TSDBControllerContainer.initialized:
             raise RuntimeError("Controller not initialized")
         return TSDBControllerContainer.controller
+
+    @staticmethod
+    async def warm_up_controller():
+        logger = structlog.getLogger("TSDBControllerContainer")
+        controller = TSDBControllerContainer.get_controller()
+        try:
+            await controller.warm_up(
+                connections=int(os.environ["WARMUP_CONNECTIONS"])
+                if os.getenv("WARMUP_CONNECTIONS", None)
+                else None,
+                radius=float(os.getenv("WARMUP_VISUALIZATION_VECTORS_RADIUS", "2.5")),
+            )
+        except Exception as ex:
+            # the connector did connect, so serve cold rather than never serve
+            logger.exception(f"Controller warm-up failed: {ex}", exc_info=ex)
+        TSDBControllerContainer.ready = True
+        time_to_ready = time.perf_counter() - TSDBControllerContainer.init_started_at
+        logger.info(f"Controller ready {time_to_ready:.2f}s after startup")
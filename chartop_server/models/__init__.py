@@ -4,12 +4,18 @@ from chartop_server.models.models import (
     ChartopResponse,
     ChartopExternal,
     MultipleTSMetadataExternal,
+    MultiOriginVisualizationVectorsExternal,
+    MultiOriginVisualizationVectorsResponse,
     SingleTimeseriesExternal,
     SingleTSMetadataExternal,
+    SummaryStatisticsResponse,
     TagsResponse,
+    TSSummaryStatisticsExternal,
     MetricsResponse,
     VisualizationVectorsResponse,
+    VisualizationVectorsNeighborhoodExternal,
     VisualizationVectorsWithOriginExternal,
+    WindowStatisticsExternal,
 )
 
 __all__ = [
@@ -18,10 +24,16 @@ __all__ = [
     "ChartopExternal",
     "ChartopResponse",
     "MultipleTSMetadataExternal",
+    "MultiOriginVisualizationVectorsExternal",
+    "MultiOriginVisualizationVectorsResponse",
     "SingleTimeseriesExternal",
     "SingleTSMetadataExternal",
+    "SummaryStatisticsResponse",
     "TagsResponse",
+    "TSSummaryStatisticsExternal",
     "MetricsResponse",
     "VisualizationVectorsResponse",
+    "VisualizationVectorsNeighborhoodExternal",
     "VisualizationVectorsWithOriginExternal",
+    "WindowStatisticsExternal",
 ]
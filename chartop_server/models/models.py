@@ -57,6 +57,55 @@ class SingleTSMetadataExternal(BaseModel):
     metrics: list[Metric] | None = Field(title="Metrics")
     has_visualization_vector: bool = Field(title="Has Visualization Vector")
 
+    @staticmethod
+    def from_db_models(
+        meta_model: TSMetadataModel,
+        ts_models: list[TSDataModel],
+        ts_to_tag_models: list[TSToTagModel] | None = None,
+        ts_to_metric_models: list[TSToMetricModel] | None = None,
+        ts_uids_with_vv: set[int] | None = None,
+    ):
+        if ts_uids_with_vv is None:
+            ts_uids_with_vv = set()
+        if not ts_to_tag_models:
+            ts_to_tag_models = []
+        if not ts_to_metric_models:
+            ts_to_metric_models = []
+
+        timezone: int = 0
+        if len(ts_models) > 0:
+            utcoffset: datetime.timedelta | None = datetime.datetime.utcoffset(
+                ts_models[0].time
+            )
+            timezone = int(
+                (utcoffset.total_seconds() * 1000) if utcoffset is not None else 0
+            )
+
+        return SingleTSMetadataExternal(
+            timezone=timezone,
+            uid=meta_model.uid,
+            name=meta_model.name,
+            description=meta_model.description,
+            unit=meta_model.unit,
+            source_uid=meta_model.source_uid,
+            uid_from_source=meta_model.uid_from_source,
+            successful_last_update_time=int(
+                meta_model.successful_last_update_time.timestamp() * 1000
+            ),
+            has_visualization_vector=meta_model.uid in ts_uids_with_vv,
+            tags=[
+                SingleTSMetadataExternal.Tag(uid=m.tag_uid) for m in ts_to_tag_models
+            ],
+            metrics=[
+                SingleTSMetadataExternal.Metric(
+                    uid=m.metric_uid,
+                    value=m.value,
+                    data=json.loads(m.data_json) if m.data_json else None,
+                )
+                for m in ts_to_metric_models
+            ],
+        )
+
 
 # class SingleTimeseriesDatapoint(BaseModel):
 #     timestamp: int = Field(title="GMT Timestamp", description="GMT milliseconds since the epoch")
@@ -83,54 +132,21 @@ class SingleTimeseriesExternal(BaseModel):
         ts_to_metric_models: list[TSToMetricModel] | None = None,
         ts_uids_with_vv: set[int] | None = None,
     ):
-        if ts_uids_with_vv is None:
-            ts_uids_with_vv = set()
-        if not ts_to_tag_models:
-            ts_to_tag_models = []
-        if not ts_to_metric_models:
-            ts_to_metric_models = []
         timestamps: list[int] = list()
         values: list[float] = list()
         for ts_model in ts_models:
             timestamps.append(int(ts_model.time.timestamp() * 1000))
             values.append(ts_model.value)
 
-        timezone: int = 0
-        if len(timestamps) > 0:
-            utcoffset: datetime.timedelta | None = datetime.datetime.utcoffset(
-                ts_models[0].time
-            )
-            timezone = int(
-                (utcoffset.total_seconds() * 1000) if utcoffset is not None else 0
-            )
-
         return SingleTimeseriesExternal(
             timestamps=timestamps,
             values=values,
-            metadata=SingleTSMetadataExternal(
-                timezone=timezone,
-                uid=meta_model.uid,
-                name=meta_model.name,
-                description=meta_model.description,
-                unit=meta_model.unit,
-                source_uid=meta_model.source_uid,
-                uid_from_source=meta_model.uid_from_source,
-                successful_last_update_time=int(
-                    meta_model.successful_last_update_time.timestamp() * 1000
-                ),
-                has_visualization_vector=meta_model.uid in ts_uids_with_vv,
-                tags=[
-                    SingleTSMetadataExternal.Tag(uid=m.tag_uid)
-                    for m in ts_to_tag_models
-                ],
-                metrics=[
-                    SingleTSMetadataExternal.Metric(
-                        uid=m.metric_uid,
-                        value=m.value,
-                        data=json.loads(m.data_json) if m.data_json else None,
-                    )
-                    for m in ts_to_metric_models
-                ],
+            metadata=SingleTSMetadataExternal.from_db_models(
+                meta_model=meta_model,
+                ts_models=ts_models,
+                ts_to_tag_models=ts_to_tag_models,
+                ts_to_metric_models=ts_to_metric_models,
+                ts_uids_with_vv=ts_uids_with_vv,
             ),
         )
 
@@ -184,3 +200,68 @@ class VisualizationVectorsWithOriginExternal(BaseModel):
 
 class VisualizationVectorsResponse(DataResponse):
     data: VisualizationVectorsWithOriginExternal
+
+
+class VisualizationVectorsNeighborhoodExternal(BaseModel):
+    origin_ts_uid: int | None = Field(
+        default=None, title="TS Origin of Search", description="Null for vector origins"
+    )
+    origin: list[float] | None = Field(title="Visualization Vector of the Origin")
+    ts_uids: list[int] = Field(
+        title="Neighbor TS UIDs",
+        description="Metadata UIDs of the shared timeseries of the response, "
+        "closest first",
+    )
+
+
+class MultiOriginVisualizationVectorsExternal(BaseModel):
+    ts_with_visualization_vectors: list[TSWithVisualizationVectorExternal] = Field(
+        title="Shared Timeseries",
+        description="Each neighbor found by any of the searches, once",
+    )
+    neighborhoods: list[VisualizationVectorsNeighborhoodExternal] = Field(
+        title="Neighborhoods",
+        description="One neighborhood per requested origin, origin_ts_uids first, "
+        "then origin_vectors, each in request order",
+    )
+
+
+class MultiOriginVisualizationVectorsResponse(DataResponse):
+    data: MultiOriginVisualizationVectorsExternal
+
+
+class WindowStatisticsExternal(BaseModel):
+    window: str = Field(
+        title="Window Spec", description="Window ending at the last point of the series"
+    )
+    count: int = Field(title="Number of Points in Window")
+    first_value: float | None = Field(default=None, title="First Value in Window")
+    change: float | None = Field(default=None, title="Last Minus First Value")
+    change_pct: float | None = Field(
+        default=None, title="Change Relative to First Value in Percent"
+    )
+    min: float | None = Field(default=None, title="Minimum Value")
+    max: float | None = Field(default=None, title="Maximum Value")
+    mean: float | None = Field(default=None, title="Mean Value")
+    slope_per_day: float | None = Field(
+        default=None, title="Least Squares Trend", description="Value change per day"
+    )
+
+
+class TSSummaryStatisticsExternal(BaseModel):
+    metadata: SingleTSMetadataExternal = Field(
+        title="TS Metadata", description="Metadata about this particular timeseries"
+    )
+    last_timestamp: int | None = Field(
+        default=None,
+        title="Last GMT Timestamp",
+        description="GMT milliseconds since the epoch",
+    )
+    last_value: float | None = Field(default=None, title="Last Value")
+    windows: list[WindowStatisticsExternal] = Field(
+        title="Window Statistics", description="In the order the windows were requested"
+    )
+
+
+class SummaryStatisticsResponse(DataResponse):
+    data: list[TSSummaryStatisticsExternal]
@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Response
+from chartop_server.controllers.tsdb.factory import TSDBControllerContainer
+from chartop_server.models import BaseResponse
+
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/ready")
+async def get_ready(response: Response) -> BaseResponse:
+    if not TSDBControllerContainer.ready:
+        response.status_code = 503
+        return BaseResponse(success=False, message="Warming up.")
+    return BaseResponse(success=True, message="Ready.")
@@ -1,12 +1,21 @@
-import os
-import datetime
+import math
 
 from fastapi import APIRouter, Query
 from chartop_server.controllers.tsdb.factory import TSDBControllerContainer
-from chartop_server.models import ChartopResponse, VisualizationVectorsResponse
+from chartop_server.controllers.prefetch.factory import (
+    AccessPatternPrefetcherContainer,
+)
+from chartop_server.controllers.tsdb.exceptions import TSDBControllerException
+from chartop_server.models import (
+    ChartopResponse,
+    VisualizationVectorsResponse,
+    MultiOriginVisualizationVectorsResponse,
+    SummaryStatisticsResponse,
+)
 from pva_tsdb_connector.enums import AllOrAnyTags
 
-from chartop_server.utils.utils import get_now
+from chartop_server.utils.utils import get_visualization_vectors_ts_window
+from chartop_server.utils.statistics import parse_window
 
 router = APIRouter(prefix="/api/v1", tags=["timeseries"])
 
@@ -23,7 +32,7 @@ async def get_chartop(
     ),
 ) -> ChartopResponse:
     controller = TSDBControllerContainer.get_controller()
-    return await controller.get_chartop(
+    response = await controller.get_chartop(
         page_number=page_number,
         page_size=page_size,
         order_by=order_by,
@@ -31,6 +40,15 @@ async def get_chartop(
         tags=tags,
         all_or_any_tags=all_or_any_tags,
     )
+    AccessPatternPrefetcherContainer.get_prefetcher().record_chartop(
+        page_number=page_number,
+        page_size=page_size,
+        order_by=order_by,
+        order_asc=order_asc,
+        tags=tags,
+        all_or_any_tags=all_or_any_tags,
+    )
+    return response
 
 
 @router.get("/visualization_vectors")
@@ -50,17 +68,129 @@ async def get_visualization_vectors(
     exclude_ts_uids: list[int] | None = Query(default=None, title="Excluded TS UIDs"),
 ) -> VisualizationVectorsResponse:
     controller = TSDBControllerContainer.get_controller()
-    start_date: datetime.datetime | None = None
-    if os.getenv("VISUALIZATION_VECTORS_TS_START_DATE_DAYS_DIFF", None) is not None:
-        start_date = get_now() - datetime.timedelta(
-            days=int(os.environ["VISUALIZATION_VECTORS_TS_START_DATE_DAYS_DIFF"])
-        )
-    return await controller.get_visualization_vectors(
+    start_date, newest_n = get_visualization_vectors_ts_window()
+    response = await controller.get_visualization_vectors(
         origin_vector=origin_vector,
         origin_ts_uid=origin_ts_uid,
         radius=radius,
         limit=limit,
         exclude_ts_uids=exclude_ts_uids,
         start_date=start_date,
-        newest_n=int(os.getenv("VISUALIZATION_VECTORS_TS_LATEST_N", "365")),
+        newest_n=newest_n,
+    )
+    if origin_ts_uid is not None:
+        AccessPatternPrefetcherContainer.get_prefetcher().record_visualization_vectors(
+            origin_ts_uid=origin_ts_uid,
+            radius=radius,
+            limit=limit,
+            exclude_ts_uids=exclude_ts_uids,
+        )
+    return response
+
+
+@router.get(
+    "/visualization_vectors/multi_origin",
+    description="Returns one neighborhood per requested origin, origin_ts_uids "
+    "first, then origin_vectors, each in request order. Neighbors are shared "
+    "between neighborhoods, listed once and referenced by their metadata.uid.",
+)
+async def get_multi_origin_visualization_vectors(
+    origin_vectors: list[str] | None = Query(
+        default=None,
+        title="Vector Origins of Search",
+        description="Each origin as comma separated components, e.g. '0.5,-1.2'.",
+    ),
+    origin_ts_uids: list[int] | None = Query(
+        default=None, title="TS Origins of Search"
+    ),
+    radius: float = Query(title="Radius of Search", example=2.5, gt=0.0),
+    limit: int = Query(title="Limit per Origin", ge=0, le=250, example=50),
+    exclude_ts_uids: list[int] | None = Query(default=None, title="Excluded TS UIDs"),
+) -> MultiOriginVisualizationVectorsResponse:
+    try:
+        parsed_origin_vectors = (
+            [[float(c) for c in v.split(",")] for v in origin_vectors]
+            if origin_vectors
+            else None
+        )
+    except ValueError as ex:
+        raise TSDBControllerException(
+            message="Malformed 'origin_vectors'.", http_status_code=400
+        ) from ex
+    if parsed_origin_vectors:
+        if len({len(v) for v in parsed_origin_vectors}) > 1:
+            raise TSDBControllerException(
+                message="All 'origin_vectors' must have the same dimension.",
+                http_status_code=400,
+            )
+        if not all(math.isfinite(c) for v in parsed_origin_vectors for c in v):
+            raise TSDBControllerException(
+                message="All 'origin_vectors' components must be finite.",
+                http_status_code=400,
+            )
+    controller = TSDBControllerContainer.get_controller()
+    start_date, newest_n = get_visualization_vectors_ts_window()
+    response = await controller.get_multi_origin_visualization_vectors(
+        origin_vectors=parsed_origin_vectors,
+        origin_ts_uids=origin_ts_uids,
+        radius=radius,
+        limit=limit,
+        exclude_ts_uids=exclude_ts_uids,
+        start_date=start_date,
+        newest_n=newest_n,
+    )
+    prefetcher = AccessPatternPrefetcherContainer.get_prefetcher()
+    for origin_ts_uid in origin_ts_uids or []:
+        prefetcher.record_visualization_vectors(
+            origin_ts_uid=origin_ts_uid,
+            radius=radius,
+            limit=limit,
+            exclude_ts_uids=exclude_ts_uids,
+        )
+    return response
+
+
+@router.get("/summary_statistics")
+async def get_summary_statistics(
+    windows: list[str] = Query(
+        title="Windows",
+        description="Each window ends at the last point of a series, e.g. "
+        "'12h', '7d', '4w', '6m', '1y' or 'all'. "
+        "'m' = 30-day months, 'y' = 365 days.",
+        min_length=1,
+        max_length=10,
+    ),
+    ts_uids: list[int] | None = Query(
+        default=None,
+        title="TS UIDs",
+        description="Exclusive with order_by.",
+        max_length=100,
+    ),
+    order_by: int | None = Query(
+        default=None,
+        title="Metric to Order By",
+        description="Summarize a chartop page instead. Exclusive with ts_uids.",
+    ),
+    page_number: int = Query(default=0, title="Page Number", ge=0, le=4, example=0),
+    page_size: int = Query(default=5, title="Page Size", ge=1, le=50, example=10),
+    order_asc: bool = Query(default=False, title="Ascending Order"),
+    tags: list[int] = Query(default=None, title="Filter by These Tags"),
+    all_or_any_tags: AllOrAnyTags = Query(
+        default=AllOrAnyTags.ANY, title="Match All or Any Tags"
+    ),
+) -> SummaryStatisticsResponse:
+    try:
+        parsed_windows = [(w, parse_window(w)) for w in windows]
+    except ValueError as ex:
+        raise TSDBControllerException(message=str(ex), http_status_code=400) from ex
+    controller = TSDBControllerContainer.get_controller()
+    return await controller.get_summary_statistics(
+        windows=parsed_windows,
+        ts_uids=ts_uids,
+        order_by=order_by,
+        page_number=page_number,
+        page_size=page_size,
+        order_asc=order_asc,
+        tags=tags,
+        all_or_any_tags=all_or_any_tags,
     )
@@ -0,0 +1,136 @@
+import asyncio
+import cProfile
+import functools
+import hmac
+import json
+import os
+import pathlib
+import random
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable
+
+import structlog
+from fastapi import Request, Response
+
+from chartop_server.utils.utils import get_now
+
+
+PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_HEADER: str = os.getenv("PROFILING_HEADER", "X-Chartop-Profile")
+PROFILING_TOKEN: str | None = os.getenv("PROFILING_TOKEN", None)
+PROFILING_SAMPLE_RATE: float = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_OUTPUT_DIR: str | None = os.getenv("PROFILING_OUTPUT_DIR", None)
+
+# None outside of profiled requests, so stages cost a single lookup when off
+_stage_timings: ContextVar[dict[str, float] | None] = ContextVar(
+    "stage_timings", default=None
+)
+# cProfile hooks the whole thread, only one request can own it at a time
+_profiler_busy: bool = False
+
+
+@contextmanager
+def profile_stage(name: str):
+    timings = _stage_timings.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def profiled(fn):
+    """Records the duration of an async method as a stage named after it."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        with profile_stage(fn.__qualname__):
+            return await fn(*args, **kwargs)
+
+    return wrapper
+
+
+def _write_profile(
+    base_path: pathlib.Path, profiler: cProfile.Profile | None, report: dict
+) -> None:
+    base_path.parent.mkdir(parents=True, exist_ok=True)
+    if profiler is not None:
+        profiler.dump_stats(base_path.with_suffix(".prof"))
+    base_path.with_suffix(".json").write_text(json.dumps(report, indent=2))
+
+
+async def profiling_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    global _profiler_busy
+    requested = PROFILING_TOKEN is not None and hmac.compare_digest(
+        request.headers.get(PROFILING_HEADER, "").encode(),
+        PROFILING_TOKEN.encode(),
+    )
+    # sampled requests only report to the output dir, so skip them without one
+    sampled = (
+        not requested
+        and PROFILING_OUTPUT_DIR is not None
+        and random.random() < PROFILING_SAMPLE_RATE
+    )
+    if not requested and not sampled:
+        return await call_next(request)
+
+    timings: dict[str, float] = dict()
+    token = _stage_timings.set(timings)
+    profiler: cProfile.Profile | None = None
+    if not _profiler_busy:
+        # other requests served meanwhile by the event loop are sampled too
+        _profiler_busy = True
+        profiler = cProfile.Profile()
+        profiler.enable()
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        total = time.perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+            _profiler_busy = False
+        _stage_timings.reset(token)
+
+    # time spent outside the controller: middleware, router code, FastAPI's
+    # return value validation and serialization, not broken down any further
+    controller_total = sum(
+        v for k, v in timings.items() if k.startswith("TSDBController.")
+    )
+    timings["outside_controller"] = max(total - controller_total, 0.0)
+    timings["total"] = total
+
+    if requested:
+        response.headers["Server-Timing"] = ", ".join(
+            f"{re.sub(r'[^A-Za-z0-9_.-]', '_', k)};dur={v * 1000:.3f}"
+            for k, v in timings.items()
+        )
+    if PROFILING_OUTPUT_DIR is not None:
+        now = get_now()
+        name = re.sub(r"[^A-Za-z0-9_-]", "_", request.url.path.strip("/"))
+        base_path = pathlib.Path(PROFILING_OUTPUT_DIR) / (
+            f"{now.strftime('%Y%m%dT%H%M%S%f')}_{name}"
+        )
+        report = {
+            "time": now.isoformat(),
+            "method": request.method,
+            "path": request.url.path,
+            "query": request.url.query,
+            "status_code": response.status_code,
+            "stage_timings_ms": {k: v * 1000 for k, v in timings.items()},
+        }
+        try:
+            await asyncio.to_thread(_write_profile, base_path, profiler, report)
+        except Exception as ex:
+            structlog.getLogger("profiling_middleware").warning(
+                f"Failed to write request profile: {ex}"
+            )
+    return response
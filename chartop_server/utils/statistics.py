@@ -0,0 +1,62 @@
+import datetime
+import re
+
+import numpy as np
+
+
+MS_PER_DAY = 24 * 3600 * 1000
+_WINDOW_UNITS = {
+    "h": datetime.timedelta(hours=1),
+    "d": datetime.timedelta(days=1),
+    "w": datetime.timedelta(weeks=1),
+    "m": datetime.timedelta(days=30),
+    "y": datetime.timedelta(days=365),
+}
+
+
+def parse_window(window: str) -> datetime.timedelta | None:
+    """Parses window specs such as '12h', '7d', '4w', '6m', '1y' or 'all' (None)."""
+    if window == "all":
+        return None
+    match = re.fullmatch(r"([1-9][0-9]*)([hdwmy])", window)
+    if match is None:
+        raise ValueError(f"Invalid window '{window}'.")
+    return int(match.group(1)) * _WINDOW_UNITS[match.group(2)]
+
+
+def compute_window_statistics(
+    timestamps: np.ndarray, values: np.ndarray, window_ms: int | None
+) -> dict:
+    """
+    Aggregates the points of an ascending series that fall within 'window_ms'
+    of its last point, or all of them if 'window_ms' is None.
+    """
+    start = 0
+    if window_ms is not None and len(timestamps) > 0:
+        start = int(
+            np.searchsorted(timestamps, timestamps[-1] - window_ms, side="left")
+        )
+    t = timestamps[start:]
+    v = values[start:]
+    if len(v) == 0:
+        return dict(count=0)
+
+    first_value = float(v[0])
+    last_value = float(v[-1])
+    slope_per_day: float | None = None
+    if len(v) > 1 and t[-1] > t[0]:
+        # least squares slope, centered to keep ms timestamps well conditioned
+        dt = (t - t.mean()) / MS_PER_DAY
+        slope_per_day = float(np.dot(dt, v - v.mean()) / np.dot(dt, dt))
+    return dict(
+        count=len(v),
+        first_value=first_value,
+        change=last_value - first_value,
+        change_pct=(last_value - first_value) / abs(first_value) * 100
+        if first_value != 0
+        else None,
+        min=float(v.min()),
+        max=float(v.max()),
+        mean=float(v.mean()),
+        slope_per_day=slope_per_day,
+    )
@@ -1,4 +1,5 @@
 import datetime
+import os
 
 
 def group_by(arr: list, k: str):
@@ -22,3 +23,12 @@ def group_by(arr: list, k: str):
 
 def get_now() -> datetime.datetime:
     return datetime.datetime.now(tz=datetime.timezone.utc)
+
+
+def get_visualization_vectors_ts_window() -> tuple[datetime.datetime | None, int]:
+    start_date: datetime.datetime | None = None
+    if os.getenv("VISUALIZATION_VECTORS_TS_START_DATE_DAYS_DIFF", None) is not None:
+        start_date = get_now() - datetime.timedelta(
+            days=int(os.environ["VISUALIZATION_VECTORS_TS_START_DATE_DAYS_DIFF"])
+        )
+    return start_date, int(os.getenv("VISUALIZATION_VECTORS_TS_LATEST_N", "365"))
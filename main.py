@@ -1,3 +1,4 @@
+import asyncio
 import os
 import uvicorn
 import structlog
@@ -7,15 +8,33 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from chartop_server.routers import timeseries, tags, metrics
+from chartop_server.routers import timeseries, tags, metrics, health
 from chartop_server.controllers.tsdb.factory import TSDBControllerContainer
+from chartop_server.controllers.prefetch.factory import (
+    AccessPatternPrefetcherContainer,
+)
 from chartop_server.controllers.tsdb.exceptions import TSDBControllerException
+from chartop_server.utils.profiling import PROFILING_ENABLED, profiling_middleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await TSDBControllerContainer.init_controller()
+    AccessPatternPrefetcherContainer.init_prefetcher()
+
+    async def warm_up():
+        await TSDBControllerContainer.warm_up_controller()
+        AccessPatternPrefetcherContainer.get_prefetcher().start()
+
+    # /ready reports not ready until this finishes, the app serves meanwhile
+    warm_up_task = asyncio.create_task(warm_up())
     yield
+    warm_up_task.cancel()
+    try:
+        await warm_up_task
+    except asyncio.CancelledError:
+        pass
+    await AccessPatternPrefetcherContainer.get_prefetcher().stop()
     controller = TSDBControllerContainer.get_controller()
     await controller.cleanup()
 
@@ -48,11 +67,17 @@ async def uvicorn_exception_handler(request: Request, exc: Exception):
     )
 
 
+app.include_router(health.router)
 app.include_router(tags.router)
 app.include_router(metrics.router)
 app.include_router(timeseries.router)
 
 
+# registered only when enabled so that regular requests skip it entirely
+if PROFILING_ENABLED:
+    app.middleware("http")(profiling_middleware)
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=os.getenv("ALLOW_ORIGINS", "").split(",")